@@ -1,31 +1,147 @@
 import pandas as pd
 import folium
-import math
+import os
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 from ortools.constraint_solver import pywrapcp, routing_enums_pb2
 
-# Função haversine para distância em km
-def haversine_distance(coord1, coord2):
-    R = 6371
-    lat1, lon1 = math.radians(coord1[0]), math.radians(coord1[1])
-    lat2, lon2 = math.radians(coord2[0]), math.radians(coord2[1])
-    dlat, dlon = lat2 - lat1, lon2 - lon1
-    a = math.sin(dlat/2)**2 + math.cos(lat1)*math.cos(lat2)*math.sin(dlon/2)**2
-    return R * 2 * math.asin(math.sqrt(a))
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
 
-# Cria matriz de distâncias
-def build_distance_matrix(coords):
-    return [[haversine_distance(c1, c2) for c2 in coords] for c1 in coords]
+if _HAS_NUMBA:
+    # Kernel JIT em float32: triângulo superior por linha, espelhado (diagonal fica zero)
+    @njit('void(float32[:], float32[:], float32[:, :])', parallel=True, fastmath=True, cache=True)
+    def _hmat(lat, lon, out):
+        D = np.float32(2 * 6371.0)
+        h = np.float32(0.5)
+        n = lat.shape[0]
+        for i in prange(n):
+            for j in range(i+1, n):
+                s_lat = np.sin((lat[j]-lat[i])*h)
+                s_lon = np.sin((lon[j]-lon[i])*h)
+                a = s_lat*s_lat + np.cos(lat[i])*np.cos(lat[j])*s_lon*s_lon
+                d = D * np.arcsin(np.sqrt(a))
+                out[i, j] = d
+                out[j, i] = d
 
+# Cria matriz de distâncias (km) a partir de pares (lat, lon) já em radianos, em float32
+# (erro < 1 m na escala urbana, metade da memória); Numba se disponível, senão NumPy vetorizado
+def _haversine_matrix(coords_rad):
+    arr = np.asarray(coords_rad, dtype=np.float32)
+    lat = np.ascontiguousarray(arr[:, 0])
+    lon = np.ascontiguousarray(arr[:, 1])
+    n = len(lat)
+    out = np.zeros((n, n), dtype=np.float32)
+    if _HAS_NUMBA:
+        _hmat(lat, lon, out)
+        return out
+    # Haversine é simétrica: calcula só os pares i<j e espelha
+    i, j = np.triu_indices(n, 1)
+    a = np.sin((lat[j]-lat[i])/2)**2 + np.cos(lat[i])*np.cos(lat[j])*np.sin((lon[j]-lon[i])/2)**2
+    d = np.float32(2 * 6371) * np.arcsin(np.sqrt(a))
+    out[i, j] = d
+    out[j, i] = d
+    return out
 
-def solve_tsp(distance_matrix, time_limit=10):
+# Até este número de nós o TSP é resolvido de forma exata (Held-Karp, O(2^n·n²));
+# acima, OR-Tools partindo do tour 2-opt
+TSP_EXACT_MAX = 13
+
+# Tour guloso pelo vizinho mais próximo a partir de `start`
+def nearest_neighbor(D, start=0):
+    n = len(D)
+    visited = np.zeros(n, dtype=bool)
+    visited[start] = True
+    route = [start]
+    for _ in range(n - 1):
+        nxt = int(np.argmin(np.where(visited, np.inf, D[route[-1]])))
+        visited[nxt] = True
+        route.append(nxt)
+    return route
+
+# Melhora o tour fechado (route[0] == route[-1]) invertendo segmentos até não haver ganho
+def _two_opt(D, route):
+    n = route.shape[0] - 1
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, n - 1):
+            for k in range(i + 1, n):
+                a, b, c, d = route[i-1], route[i], route[k], route[k+1]
+                if D[a, b] + D[c, d] > D[a, c] + D[b, d] + 1e-9:
+                    lo, hi = i, k
+                    while lo < hi:
+                        route[lo], route[hi] = route[hi], route[lo]
+                        lo += 1
+                        hi -= 1
+                    improved = True
+    return route
+
+# Tour fechado ótimo a partir do nó 0 por programação dinâmica sobre subconjuntos
+# (dp[mask, j]: menor caminho de 0 que visita `mask` e termina em j; nós 1..n-1 viram bits 0..n-2)
+def _held_karp(D):
+    n = D.shape[0]
+    m = n - 1
+    full = (1 << m) - 1
+    dp = np.full((1 << m, m), np.inf)
+    parent = np.full((1 << m, m), -1, dtype=np.int64)
+    for j in range(m):
+        dp[1 << j, j] = D[0, j+1]
+    for mask in range(1, 1 << m):
+        for j in range(m):
+            prev = mask ^ (1 << j)
+            if not (mask >> j) & 1 or prev == 0:
+                continue
+            best, arg = np.inf, -1
+            for k in range(m):
+                if (prev >> k) & 1:
+                    c = dp[prev, k] + D[k+1, j+1]
+                    if c < best:
+                        best, arg = c, k
+            dp[mask, j] = best
+            parent[mask, j] = arg
+    best, last = np.inf, -1
+    for j in range(m):
+        c = dp[full, j] + D[j+1, 0]
+        if c < best:
+            best, last = c, j
+    route = np.zeros(n + 1, dtype=np.int64)
+    mask, j = full, last
+    for pos in range(m, 0, -1):
+        route[pos] = j + 1
+        j, mask = parent[mask, j], mask ^ (1 << j)
+    return route
+
+if _HAS_NUMBA:
+    _two_opt = njit(cache=True)(_two_opt)
+    _held_karp = njit(cache=True)(_held_karp)
+
+def solve_tsp_2opt(D):
+    D = np.ascontiguousarray(D, dtype=np.float64)
+    route = np.array(nearest_neighbor(D, start=0) + [0], dtype=np.int64)
+    return _two_opt(D, route).tolist()
+
+def solve_tsp_exact(D):
+    return _held_karp(np.ascontiguousarray(D, dtype=np.float64)).tolist()
+
+
+def solve_tsp(distance_matrix, time_limit=2):
     size = len(distance_matrix)
+    # Até 2 paradas além do início qualquer ordem fecha o mesmo ciclo: usa a ordem do arquivo
+    if size <= 3:
+        return list(range(size)) + [0]
+    if size <= TSP_EXACT_MAX:
+        return solve_tsp_exact(distance_matrix)
     manager = pywrapcp.RoutingIndexManager(size, 1, 0)
     routing = pywrapcp.RoutingModel(manager)
 
-    def distance_callback(from_idx, to_idx):
-        return int(distance_matrix[manager.IndexToNode(from_idx)][manager.IndexToNode(to_idx)] * 1000)
-
-    transit_idx = routing.RegisterTransitCallback(distance_callback)
+    # Matriz inteira (metros) lida direto pelo C++, sem callback Python por arco
+    int_matrix = (np.asarray(distance_matrix) * 1000).astype(np.int32).tolist()
+    transit_idx = routing.RegisterTransitMatrix(int_matrix)
     routing.SetArcCostEvaluatorOfAllVehicles(transit_idx)
     routing.AddDimension(transit_idx, 0, int(1e9), True, 'Distance')
 
@@ -34,7 +150,14 @@ def solve_tsp(distance_matrix, time_limit=10):
     params.local_search_metaheuristic = routing_enums_pb2.LocalSearchMetaheuristic.GUIDED_LOCAL_SEARCH
     params.time_limit.seconds = time_limit
 
-    sol = routing.SolveWithParameters(params)
+    # Parte do tour 2-opt (sem o depósito) e deixa o GLS só refinar;
+    # por isso o limite de tempo padrão é curto
+    init = [manager.NodeToIndex(i) for i in solve_tsp_2opt(distance_matrix)[1:-1]]
+    initial = routing.ReadAssignmentFromRoutes([init], True)
+    if initial:
+        sol = routing.SolveFromAssignmentWithParameters(initial, params)
+    else:
+        sol = routing.SolveWithParameters(params)
     if sol:
         idx = routing.Start(0)
         route = []
@@ -45,130 +168,214 @@ def solve_tsp(distance_matrix, time_limit=10):
         return route
     return list(range(size))
 
-# Carrega e limpa dados
-df = pd.read_csv('dbcaminhoesTESTE.csv', sep=';', encoding='utf-8')
-df.columns = df.columns.str.strip()
-for c in df.select_dtypes('object'):
-    df[c] = df[c].str.strip()
-
-
-df['PESO'] = pd.to_numeric(df['PESO'].str.replace(',', '.'), errors='coerce')
-df['FATURAMENTO'] = (
-    df['FATURAMENTO']
-      .str.replace(r'R\$', '', regex=True)
-      .str.replace(r'\.', '', regex=True)
-      .str.replace(',', '.', regex=True)
-      .str.strip()
-)
-df['FATURAMENTO'] = pd.to_numeric(df['FATURAMENTO'], errors='coerce')
+# Comprimento do caminho aberto que visita `seq` na ordem dada
+def _path_len(D, seq):
+    return sum(D[a, b] for a, b in zip(seq, seq[1:]))
 
-
-df_group = df.groupby('MOTORISTA').agg(
-    PESO_TOTAL=('PESO','sum'),
-    CARGA_UTIL=('CARGA','first'),
-    VALOR_TOTAL=('FATURAMENTO','sum')
-).reset_index()
-df_group['USO_%'] = df_group['PESO_TOTAL'] / df_group['CARGA_UTIL'] * 100
-faturamento_total = df_group['VALOR_TOTAL'].sum()
-
-
-colors = ['red','blue','green','purple','orange','darkred','darkblue','coral','cadetblue','darkpurple','pink','lightblue','lightgreen','gray','black', 'yello']
-truck_colors = {t: colors[i%len(colors)] for i,t in enumerate(df['MOTORISTA'].unique())}
-
-
-mapa = folium.Map(location=[df['LATITUDE CASA'].mean(), df['LONGITUDE CASA'].mean()], zoom_start=10)
-
-
-for truck, grp in df.groupby('MOTORISTA'):
-    rows = grp.to_dict('records')
-    depot = (rows[0]['LATITUDE CASA'], rows[0]['LONGITUDE CASA'])
+# Roteiriza um caminhão; devolve só dados simples (picklable) para o processo principal:
+# o depósito e os rótulos de índice das entregas na ordem de visita
+def process_truck(grp):
+    depot = (grp['LATITUDE_CASA'].iat[0], grp['LONGITUDE_CASA'].iat[0])
 
     
-    manha = [r for r in rows if r.get('TURNO RECEBIMENTO','').strip().upper()=='MANHA']
-    diurno = [r for r in rows if r not in manha]
+    is_m = grp['TURNO_U'] == 'MANHA'
+    manha = list(grp[is_m].itertuples())
+    diurno = list(grp[~is_m].itertuples())
 
     
+    # Uma única matriz por caminhão: [depot] + manha + diurno; cada turno usa um recorte
+    all_pts = ([(grp['LATITUDE_CASA_R'].iat[0], grp['LONGITUDE_CASA_R'].iat[0])]
+               + [(r.LATITUDE_R, r.LONGITUDE_R) for r in manha + diurno])
+    M = _haversine_matrix(all_pts)
+    n_m = len(manha)
+
     ordered_manha = []
-    last_loc = depot
+    last_idx = 0
     if manha:
-        coords_m = [depot] + [(r['LATITUDE'],r['LONGITUDE']) for r in manha]
-        dm = build_distance_matrix(coords_m)
+        dm = M[:n_m + 1, :n_m + 1]
         route1 = solve_tsp(dm)
         if route1 and route1[-1]==0:
             route1 = route1[:-1]
-        ordered_manha = [manha[i-1] for i in route1 if i>0]
-        last_loc = coords_m[route1[-1]]
+        # O ciclo vale nos dois sentidos, mas o trajeto desenhado não volta ao depósito:
+        # percorre no sentido que deixa de fora a aresta de retorno mais longa
+        if len(route1) > 2 and dm[route1[1], 0] > dm[route1[-1], 0]:
+            route1 = [0] + route1[:0:-1]
+        ordered_manha = [manha[i-1].Index for i in route1 if i>0]
+        last_idx = route1[-1]
 
     
     ordered_diurno = []
     if diurno:
-        coords_d = [last_loc] + [(r['LATITUDE'],r['LONGITUDE']) for r in diurno]
-        dd = build_distance_matrix(coords_d)
+        idx_d = [last_idx] + list(range(n_m + 1, len(all_pts)))
+        dd = M[np.ix_(idx_d, idx_d)]
         route2 = solve_tsp(dd)
         if route2 and route2[-1]==0:
             route2 = route2[:-1]
       
         cycle = [i for i in route2 if i>0]
         
-        distances = [haversine_distance(last_loc, coords_d[i]) for i in cycle]
-        nearest_pos = distances.index(min(distances))
+        nearest_pos = int(np.argmin(dd[0, np.asarray(cycle)]))
         rotated = cycle[nearest_pos:] + cycle[:nearest_pos]
-        ordered_diurno = [diurno[i-1] for i in rotated]
+        reverse = rotated[:1] + rotated[:0:-1]
+        if _path_len(dd, [0] + reverse) < _path_len(dd, [0] + rotated):
+            rotated = reverse
+        ordered_diurno = [diurno[i-1].Index for i in rotated]
 
-    
-    ordered = ordered_manha + ordered_diurno
+    return depot, ordered_manha + ordered_diurno
+
+
+# Emoji do marcador por turno (demais turnos: 🚚)
+EMOJI = {'MANHA': '☀️', 'DIURNO': '🕒', 'DIURNO ALERTA': '⚡'}
+
+# Template HTML do ícone de cada parada, montado uma vez
+_ICON_TMPL = (
+    "<div style='width:34px;height:34px;background:{c};border-radius:50%;"
+    "display:flex;flex-direction:column;align-items:center;justify-content:center;color:white;'>"
+    "<span style='font-weight:bold;'>{i}</span><span>{e}</span></div>"
+)
+
+
+def main():
+    # Carrega e limpa dados
+    df = pd.read_csv('dbcaminhoesTESTE.csv', sep=';', encoding='utf-8')
+    df.columns = df.columns.str.strip()
+    for c in df.select_dtypes('object'):
+        df[c] = df[c].str.strip()
+    # Nomes de coluna como identificadores válidos para acesso por atributo no itertuples
+    df.columns = df.columns.str.replace(' ', '_')
+    # Turno normalizado uma vez (sem '_' inicial: itertuples renomearia o campo)
+    df['TURNO_U'] = df['TURNO_RECEBIMENTO'].str.strip().str.upper()
+    # Coordenadas convertidas para radianos uma única vez
+    for c in ('LATITUDE', 'LONGITUDE', 'LATITUDE_CASA', 'LONGITUDE_CASA'):
+        df[c + '_R'] = np.radians(df[c])
+    # Motorista como category: groupby e cores trabalham com códigos inteiros
+    df['MOTORISTA'] = df['MOTORISTA'].astype('category')
+
+
+    df['PESO'] = pd.to_numeric(df['PESO'].str.replace(',', '.', regex=False), errors='coerce')
+    # Remove 'R$', separador de milhar e espaços em uma única passada; vírgula vira ponto
+    df['FATURAMENTO'] = pd.to_numeric(
+        df['FATURAMENTO']
+          .str.replace(r'R\$|\.|\s', '', regex=True)
+          .str.replace(',', '.', regex=False),
+        errors='coerce'
+    )
+
+
+    # Popup de cada parada montado de uma vez para o DataFrame todo; só a ordem entra no loop
+    df['POPUP_TOPO'] = "<b>Motorista:</b>  " + df['MOTORISTA'].astype(str) + "<br><b>Ordem:</b> "
+    df['POPUP_CORPO'] = (
+        "<br><b>Cliente:</b> " + df['NOME_FANTASIA'].astype(str)
+        + "<br><b>Turno:</b> " + df['TURNO_U'].astype(str)
+        + "<br><b>Peso:</b> " + df['PESO'].map('{:.1f}'.format)
+        + "<br><b>Faturamento:</b> R$ " + df['FATURAMENTO'].map('{:.2f}'.format)
+    )
+
+
+    df_group = df.groupby('MOTORISTA', observed=True).agg(
+        PESO_TOTAL=('PESO','sum'),
+        CARGA_UTIL=('CARGA','first'),
+        VALOR_TOTAL=('FATURAMENTO','sum')
+    ).reset_index()
+    df_group['USO_%'] = df_group['PESO_TOTAL'] / df_group['CARGA_UTIL'] * 100
+    faturamento_total = df_group['VALOR_TOTAL'].sum()
+
+
+    colors = ['red','blue','green','purple','orange','darkred','darkblue','coral','cadetblue','darkpurple','pink','lightblue','lightgreen','gray','black', 'yello']
+    # Cor por código da categoria; atribuída na ordem em que o motorista aparece no arquivo
+    color_arr = ['gray'] * len(df['MOTORISTA'].cat.categories)
+    for i, code in enumerate(pd.unique(df['MOTORISTA'].cat.codes)):
+        color_arr[code] = colors[i%len(colors)]
+
+
+    mapa = folium.Map(location=[df['LATITUDE_CASA'].mean(), df['LONGITUDE_CASA'].mean()], zoom_start=10)
+
+
+    # Caminhões são independentes, mas cada worker 'spawn' reimporta pandas/folium/OR-Tools/Numba
+    # (~1,5 s) e turnos de até TSP_EXACT_MAX nós saem em milissegundos. O pool só compensa quando
+    # dois ou mais caminhões têm turno que vai para o OR-Tools (limite de 2 s cada); senão roda aqui.
+    # Mapa montado no processo principal (folium não é picklable).
+    # 'spawn' porque o pool de threads do Numba (TBB) não sobrevive a fork
+    groups = list(df.groupby('MOTORISTA', observed=True))
+    n_ortools = 0
+    for _, grp in groups:
+        n_m = int((grp['TURNO_U'] == 'MANHA').sum())
+        if max(n_m, len(grp) - n_m) + 1 > TSP_EXACT_MAX:
+            n_ortools += 1
+    workers = min(n_ortools, os.cpu_count() or 1)
+    if workers <= 1:
+        results = [process_truck(grp) for _, grp in groups]
+    else:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=mp.get_context('spawn')) as pool:
+            results = list(pool.map(process_truck, [grp for _, grp in groups]))
+
+    for (truck, grp), (depot, order) in zip(groups, results):
+        ordered = list(df.loc[order].itertuples(index=False))
 
  
-    fg = folium.FeatureGroup(name=f'Caminhão: {truck}')
-    color = truck_colors[truck]
+        fg = folium.FeatureGroup(name=f'Caminhão: {truck}')
+        color = color_arr[grp['MOTORISTA'].cat.codes.iat[0]]
  
-    folium.Marker(depot, popup='VALEMILK-CD', icon=folium.Icon(color=color, icon='home', prefix='fa')).add_to(fg)
-
-    prev = depot
-    for idx, r in enumerate(ordered, start=1):
-        loc = (r['LATITUDE'], r['LONGITUDE'])
-        folium.PolyLine([prev,loc], color=color, weight=2, opacity=0.8).add_to(fg)
-        prev = loc
-        turno = r.get('TURNO RECEBIMENTO','').strip().upper()
-        emoji = '☀️' if turno=='MANHA' else ('🕒' if turno=='DIURNO' else '⚡' if turno=='DIURNO ALERTA' else'🚚')
-        icon_html = (
-            f"<div style='width:34px;height:34px;background:{color};border-radius:50%;"
-            f"display:flex;flex-direction:column;align-items:center;justify-content:center;color:white;'>"
-            f"<span style='font-weight:bold;'>{idx}</span><span>{emoji}</span></div>"
-        )
-        icon = folium.DivIcon(html=icon_html)
-        popup = ( f"<b>Motorista:</b>  {r['MOTORISTA']}<br>"
-                    f"<b>Ordem:</b> {idx}<br><b>Cliente:</b> {r['NOME FANTASIA']}<br>"
-                    f"<b>Turno:</b> {turno}<br><b>Peso:</b> {r['PESO']}<br>"
-                    f"<b>Faturamento:</b> R$ {r['FATURAMENTO']}")
-        folium.Marker(loc, popup=popup, tooltip=f"{idx} - {r['NOME FANTASIA']} ({turno})", icon=icon).add_to(fg)
-
-    fg.add_to(mapa)
-
-# Legenda e controle
-folium.LayerControl().add_to(mapa)
-unique_markers = df['NOME FANTASIA'].nunique()
-legend = folium.Element(
-    '<div style="position:fixed;bottom:50px;left:50px;width:300px;'
-    'background:white;border:2px solid grey;z-index:9999;padding:10px;'
-    'box-shadow:2px 2px 5px rgba(0,0,0,0.3)">' +
-    f'<b>Clientes totais:</b> {unique_markers}<br>' +
-    f'<b>Faturamento total:</b> R$ {faturamento_total:.2f}<br>' +
-    f'<b>Turnos:</b> ☀️ = Manhã , 🕒 = Diurno, ⚡ = Recebe até as 16h<br>' +
-    f'<b>Atualizado:</b> Saida:27/06/2025 <br><br>' +
-    ''.join([
-        f"<div style='display:flex;align-items:center;margin-bottom:5px;'>"
-        f"<div style='width:15px;height:15px;background:{truck_colors.get(row['MOTORISTA'], 'gray')};"
-        f"border-radius:50%;margin-right:8px;'></div>"
-        f"<b>{row['MOTORISTA']}</b>: R$ {row['VALOR_TOTAL']:.2f} / Uso: {row['USO_%']:.0f}%"
-        f"</div>"
-        for _, row in df_group.iterrows()
-    ]) +
-    '</div>'
+        folium.Marker(depot, popup='VALEMILK-CD', icon=folium.Icon(color=color, icon='home', prefix='fa')).add_to(fg)
+
+        # Uma PolyLine e um único GeoJson por caminhão em vez de objetos folium por parada
+        folium.PolyLine([depot] + [(r.LATITUDE, r.LONGITUDE) for r in ordered],
+                        color=color, weight=2, opacity=0.8).add_to(fg)
+        features = []
+        for idx, r in enumerate(ordered, start=1):
+            turno = r.TURNO_U
+            features.append({
+                'type': 'Feature',
+                'id': idx,
+                'geometry': {'type': 'Point', 'coordinates': [r.LONGITUDE, r.LATITUDE]},
+                'properties': {
+                    'emoji': EMOJI.get(turno, '🚚'),
+                    'popup': f"{r.POPUP_TOPO}{idx}{r.POPUP_CORPO}",
+                    'tooltip': f"{idx} - {r.NOME_FANTASIA} ({turno})",
+                },
+            })
+        # O style_function do GeoJson é aplicado às opções do DivIcon: cada parada recebe seu html
+        # (cor fixada no default do lambda, que só é avaliado no render)
+        folium.GeoJson(
+            {'type': 'FeatureCollection', 'features': features},
+            marker=folium.Marker(icon=folium.DivIcon()),
+            style_function=lambda f, c=color: {'html': _ICON_TMPL.format(c=c, i=f['id'], e=f['properties']['emoji'])},
+            popup=folium.GeoJsonPopup(fields=['popup'], labels=False),
+            tooltip=folium.GeoJsonTooltip(fields=['tooltip'], labels=False),
+            control=False,
+        ).add_to(fg)
+
+        fg.add_to(mapa)
+
+    # Legenda e controle
+    folium.LayerControl().add_to(mapa)
+    unique_markers = df['NOME_FANTASIA'].nunique()
+    legend = folium.Element(
+        '<div style="position:fixed;bottom:50px;left:50px;width:300px;'
+        'background:white;border:2px solid grey;z-index:9999;padding:10px;'
+        'box-shadow:2px 2px 5px rgba(0,0,0,0.3)">' +
+        f'<b>Clientes totais:</b> {unique_markers}<br>' +
+        f'<b>Faturamento total:</b> R$ {faturamento_total:.2f}<br>' +
+        f'<b>Turnos:</b> ☀️ = Manhã , 🕒 = Diurno, ⚡ = Recebe até as 16h<br>' +
+        f'<b>Atualizado:</b> Saida:27/06/2025 <br><br>' +
+        ''.join([
+            f"<div style='display:flex;align-items:center;margin-bottom:5px;'>"
+            f"<div style='width:15px;height:15px;background:{color_arr[code]};"
+            f"border-radius:50%;margin-right:8px;'></div>"
+            f"<b>{row['MOTORISTA']}</b>: R$ {row['VALOR_TOTAL']:.2f} / Uso: {row['USO_%']:.0f}%"
+            f"</div>"
+            for code, (_, row) in zip(df_group['MOTORISTA'].cat.codes, df_group.iterrows())
+        ]) +
+        '</div>'
     
-)
-mapa.get_root().html.add_child(legend)
+    )
+    mapa.get_root().html.add_child(legend)
+
+    # Salva mapa final
+    mapa.save('rota_otimizada_prioridade_manha.html')
+    print('Mapa reprocessado com priorização dinâmica e TSP ajustado.')
+
 
-# Salva mapa final
-mapa.save('rota_otimizada_prioridade_manha.html')
-print('Mapa reprocessado com priorização dinâmica e TSP ajustado.')
\ No newline at end of file
+if __name__ == '__main__':
+    main()